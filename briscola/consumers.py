@@ -1,36 +1,36 @@
 import json
+from collections import deque
 
-from asgiref.sync import async_to_sync
-from channels.generic.websocket import WebsocketConsumer
+from channels.generic.websocket import AsyncWebsocketConsumer
 
 
 service_group_name = 'briscola_service'
 
-class BriscolaClientConsumer(WebsocketConsumer):
+class BriscolaClientConsumer(AsyncWebsocketConsumer):
     def __init__(self, *args, **kwargs):
-        super().__init__(args, kwargs)
+        super().__init__(*args, **kwargs)
         self.game_id_name = None
         self.game_id = None
 
-    def connect(self):
+    async def connect(self):
         print(self.scope['user'])
 
         # if self.scope['user'].is_authenticated:
-        self.accept()
+        await self.accept()
         # else:
-        #     self.close()
+        #     await self.close()
 
-    def disconnect(self, code):
+    async def disconnect(self, code):
         pass
 
-    def receive(self, text_data=None, bytes_data=None):
+    async def receive(self, text_data=None, bytes_data=None):
         """Handles all messages coming from the web client. Typically, dispatches messages to the channel layer to
         go to another Consumer for """
         message = json.loads(text_data)
         message_type = message['message_type']
         print(message_type)
         if message_type == 'create':
-            async_to_sync(self.channel_layer.group_send)(
+            await self.channel_layer.group_send(
                 service_group_name,
                 {
                     'type' : 'service.create',
@@ -40,7 +40,7 @@ class BriscolaClientConsumer(WebsocketConsumer):
             )
 
         else:
-            async_to_sync(self.channel_layer.group_send)(
+            await self.channel_layer.group_send(
                 self.game_server_id_name,
                 {
                     'type': 'player.action',
@@ -48,84 +48,84 @@ class BriscolaClientConsumer(WebsocketConsumer):
                 }
              )
 
-    def game_update(self, event):
+    async def game_update(self, event):
         """Handles game.update messages coming from BriscolaServerConsumer"""
-        message = json.loads(event['message'])
-        if message['message_type'] == 'create':
-            if message['result'] == 'success':
-                self.join_game(message['game_id'])
+        if event['message_type'] == 'create':
+            if event['result'] == 'success':
+                await self.join_game(event['game_id'])
             else:
-                self.send('create failed')
+                await self.send('create failed')
 
-        self.send(text_data=event['message'])
+        await self.send(text_data=event['message'])
 
-    def join_game(self, game_id):
+    async def join_game(self, game_id):
         self.game_id = game_id
-        async_to_sync(self.channel_layer.group_add)(self.game_id,
-                                                    self.channel_name)
+        await self.channel_layer.group_add(self.game_id, self.channel_name)
 
 
         print('joining game %s' % game_id)
 
 
 
-class BriscolaServiceConsumer(WebsocketConsumer):
+class BriscolaServiceConsumer(AsyncWebsocketConsumer):
     groups = [service_group_name]
 
     def __init__(self, *args, **kwargs):
-        super().__init__(args, kwargs)
-        self.create_requestors = []
+        super().__init__(*args, **kwargs)
+        self.create_requestors = deque()
 
-    def connect(self):
+    async def connect(self):
 
-        self.accept()
+        await self.accept()
 
-    def disconnect(self, code):
+    async def disconnect(self, code):
         pass
 
-    def receive(self, text_data=None, bytes_data=None):
+    async def receive(self, text_data=None, bytes_data=None):
         message = json.loads(text_data)
         if message['message_type'] == 'create':
-            channel_name = self.create_requestors[0]
-            self.create_requestors.remove(channel_name)
-            async_to_sync(self.channel_layer.send)(
+            channel_name = self.create_requestors.popleft()
+            await self.channel_layer.send(
                 channel_name,
                 {
                     'type': 'game.update',
+                    'message_type': message['message_type'],
+                    'result': message.get('result'),
+                    'game_id': message.get('game_id'),
                     'message': text_data
                 }
             )
         pass
 
-    def service_create(self, event):
-        message = json.loads(event['message'])
+    async def service_create(self, event):
         self.create_requestors.append(event['requestor'])
-        self.send(text_data=event['message'])
+        await self.send(text_data=event['message'])
 
-class BriscolaServerConsumer(WebsocketConsumer):
+class BriscolaServerConsumer(AsyncWebsocketConsumer):
     def __init__(self, *args, **kwargs):
-        super().__init__(args, kwargs)
+        super().__init__(*args, **kwargs)
         self.game_id = None
 
-    def connect(self):
-        self.accept()
+    async def connect(self):
+        await self.accept()
 
 
-    def disconnect(self, code):
+    async def disconnect(self, code):
         pass
 
-    def receive(self, text_data=None, bytes_data=None):
+    async def receive(self, text_data=None, bytes_data=None):
         message = json.loads(text_data)
         if message['message_type'] == 'created':
             self.game_id = message['game_id']
 
-            async_to_sync(self.channel_layer.group_send)(
+            await self.channel_layer.group_send(
                 self.game_id,
                 {
                     'type': 'game.update',
+                    'message_type': message['message_type'],
                     'message': text_data
                 }
             )
 
-    def player_action(self, event):
-        self.send(event['message'])
+    async def player_action(self, event):
+        await self.send(event['message'])
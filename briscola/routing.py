@@ -1,10 +1,10 @@
 
-from django.urls import re_path
+from django.urls import path
 
 from . import consumers
 
 websocket_urlpatterns = [
-    re_path(r'ws/client/$', consumers.BriscolaClientConsumer.as_asgi()),
-    re_path(r'ws/gameserver/$', consumers.BriscolaServerConsumer.as_asgi()),
-    re_path(r'ws/gameservice/', consumers.BriscolaServiceConsumer.as_asgi()),
+    path('ws/client/', consumers.BriscolaClientConsumer.as_asgi()),
+    path('ws/gameserver/', consumers.BriscolaServerConsumer.as_asgi()),
+    path('ws/gameservice/', consumers.BriscolaServiceConsumer.as_asgi()),
 ]
\ No newline at end of file
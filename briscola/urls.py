@@ -1,6 +1,6 @@
-from django.urls import path, re_path
+from django.urls import path
 
-from . import views, consumers
+from . import views
 
 urlpatterns = [
     path('create/', views.create, name='create'),
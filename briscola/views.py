@@ -1,6 +1,5 @@
 import json
 
-import zmq
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render